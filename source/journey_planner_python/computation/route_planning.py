@@ -1,61 +1,111 @@
 """route_planning.py: Functions for route planning."""
 
-from random import randint
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
-from geopy.geocoders import Nominatim
+import numpy as np
+import numpy.typing as npt
 
 from ..config.constants import Constants
 from ..integrations.google_maps import (
     compute_route,
+    geocode_address,
     get_distance_matrix,
     search_nearby_places,
 )
 
 
-def find_longitude_and_latitude(location: str) -> tuple[float, float]:
+def _haversine_vec(
+    origin_lat: float, origin_lng: float, lats: npt.ArrayLike, lngs: npt.ArrayLike
+) -> npt.NDArray[np.float64]:
     """
-    Find the longitude and latitude of a location.
+    Compute the great-circle distances from one point to many others.
 
     Parameters
     ----------
-    location : str
-        The location to find the longitude and latitude of.
+    origin_lat : float
+        The latitude of the origin point.
+    origin_lng : float
+        The longitude of the origin point.
+    lats : npt.ArrayLike
+        The latitudes of the other points.
+    lngs : npt.ArrayLike
+        The longitudes of the other points.
 
     Returns
     -------
-    tuple[float, float]
-        A tuple containing the longitude and latitude of the location.
+    npt.NDArray[np.float64]
+        The distance from the origin to each point, in meters.
 
-    Raises
-    ------
-    ValueError
-        If the location is not found.
+    Notes
+    -----
+    Vectorized with NumPy, so scoring a whole pool of nearby places
+    costs microseconds compared to a round-trip to the Routes API.
+    """
+    origin_lat_rad, origin_lng_rad = np.radians(origin_lat), np.radians(origin_lng)
+    lats_rad, lngs_rad = np.radians(np.asarray(lats)), np.radians(np.asarray(lngs))
+
+    a = (
+        np.sin((lats_rad - origin_lat_rad) / 2) ** 2
+        + np.cos(origin_lat_rad) * np.cos(lats_rad) * np.sin((lngs_rad - origin_lng_rad) / 2) ** 2
+    )
+    distances: npt.NDArray[np.float64] = 2 * Constants.EARTH_RADIUS_METERS * np.arcsin(np.sqrt(a))
+    return distances
 
-    Examples
-    --------
-    >>> get_location_coordinates("New York")
-    (40.7128, -74.0060)
 
-    >>> get_location_coordinates("Los Angeles")
-    (34.0522, -118.2437)
+def _order_waypoints(
+    start_latlong: tuple[float, float],
+    end_latlong: tuple[float, float],
+    waypoint_latlongs: list[tuple[float, float]],
+) -> list[tuple[float, float]]:
+    """
+    Reorder the stops between a fixed start and end to shorten the overall path.
+
+    Parameters
+    ----------
+    start_latlong : tuple[float, float]
+        The latitude and longitude of the start of the route.
+    end_latlong : tuple[float, float]
+        The latitude and longitude of the end of the route.
+    waypoint_latlongs : list[tuple[float, float]]
+        The latitudes and longitudes of the stops, in their current order.
+
+    Returns
+    -------
+    list[tuple[float, float]]
+        The same stops, reordered.
 
     Notes
     -----
-    This function finds the longitude and latitude of a given location.
-    It takes in the location as a string and returns a tuple containing
-    the longitude and latitude of the location.
-    It uses the Nominatim geocoding service from OpenStreetMap to find
-    the location. If the location is not found, it raises a ValueError.
+    Applies 2-opt to the straight-line distances between the points:
+    any section of the path whose reversal makes the path shorter is
+    reversed, until no reversal helps. With at most eight stops this
+    takes well under a millisecond, and unlike asking the Routes API to
+    optimize the waypoint order, it doesn't move the request onto a
+    more expensive billing tier.
     """
-    geolocator = Nominatim(user_agent="geoapiExercises")  # geolocator object
-    location_data = geolocator.geocode(location)
+    points = [start_latlong, *waypoint_latlongs, end_latlong]
+    lats = np.fromiter((latlong[0] for latlong in points), dtype=np.float64, count=len(points))
+    lngs = np.fromiter((latlong[1] for latlong in points), dtype=np.float64, count=len(points))
+    distances = np.vstack([_haversine_vec(lat, lng, lats, lngs) for lat, lng in points])
+
+    order = list(range(len(points)))  # The start and end stay at either end
+    for _ in range(Constants.WAYPOINT_ORDERING_MAX_PASSES):
+        improved = False
+        for i in range(1, len(order) - 2):
+            for j in range(i + 2, len(order)):  # Reverse order[i:j], keeping j exclusive
+                before, first, last, after = order[i - 1], order[i], order[j - 1], order[j]
+                if (
+                    distances[before, last] + distances[first, after]
+                    < distances[before, first] + distances[last, after]
+                ):
+                    order[i:j] = reversed(order[i:j])
+                    improved = True
+        if not improved:
+            break
 
-    if location_data:
-        latitude: float = location_data.latitude
-        longitude: float = location_data.longitude
-        return latitude, longitude
-    else:
-        raise ValueError("Location not found.")
+    return [points[index] for index in order[1:-1]]
 
 
 def plan_route(start: str, end: str, duration: int, API_KEY: str) -> dict[str, str | int]:
@@ -93,61 +143,159 @@ def plan_route(start: str, end: str, duration: int, API_KEY: str) -> dict[str, s
     information: distance in meters, duration in seconds, and
     an encoded polyline of the route.
     It does this by first searching for nearby points of interest
-    within the specified duration of the starting location. It then
-    selects a random point of interest to travel to, subtracts the
-    time taken to travel to that point from the total duration, and
-    repeats the process until the remaining duration is less than
-    the time taken to travel to the given ending location.
+    within the specified duration of the starting location, keeping
+    them as a pool that is only searched again once it runs dry or the
+    route has moved away from where it was fetched. Points of interest
+    that couldn't be reached in time even in a straight line at top
+    speed are ruled out locally. The rest are scored by how close their
+    estimated travel time is to half the remaining duration, and the
+    legs to and from the best few are timed with the Distance Matrix
+    API. It travels to the best-scored one that still leaves time
+    to reach the ending location, subtracts the time taken to travel to
+    that point from the total duration, and repeats the process until
+    no point of interest fits within the remaining duration, too little
+    time is left for another stop, or the iteration limit is reached.
+    Finally, the chosen points of interest are reordered to shorten the
+    overall route before it is computed.
     """
-    # Get initial journey details
-    start_to_end_distance_matrix = get_distance_matrix(start, end, API_KEY)
-    start_latlong = find_longitude_and_latitude(start_to_end_distance_matrix["start_location"])
-    end_latlong = find_longitude_and_latitude(start_to_end_distance_matrix["end_location"])
-    remaining_duration = duration
-    intermediate_latlongs = []
-
-    # Check if ending location is reachable within the specified duration
-    if start_to_end_distance_matrix["duration"] > duration:
-        raise ValueError("Ending location not reachable within the specified duration.")
-
-    # Find latlongs of nearby places and plan the route
-    while remaining_duration > 0:
-        # Search for nearby places within the remaining duration
-        nearby_places = search_nearby_places(
-            API_KEY,
-            start_latlong,
-            remaining_duration * Constants.CONVERSION_FACTOR_MINUTES_TO_METERS,
-        )
-
-        # Select a random place to travel to
-        try:
-            selected_place = nearby_places.pop(randint(0, len(nearby_places) - 1))
-            selected_latlong = find_longitude_and_latitude(selected_place["formatted_address"])
-        except IndexError:
-            break  # Ran out of nearby places to search for
-
-        # Compute the route to the selected place and the ending location
-        route_to_selection = compute_route(API_KEY, start_latlong, selected_latlong)
-        route_to_end = compute_route(API_KEY, selected_latlong, end_latlong)
-
-        if (
-            route_to_selection["duration_seconds"] + route_to_end["duration_seconds"]
-            <= remaining_duration
-        ):
-            # Update the remaining duration and the route list
-            remaining_duration -= route_to_selection["duration_seconds"]
-            intermediate_latlongs.append(selected_latlong)
-            start_latlong = selected_latlong
+    # Get initial journey details, geocoding both ends alongside the distance request,
+    # on a pool that is then reused for the concurrent requests of every planning step
+    with ThreadPoolExecutor(max_workers=3) as executor:  # The three setup lookups at most
+        start_to_end_request = executor.submit(get_distance_matrix, API_KEY, [start], [end])
+        start_latlong_request = executor.submit(geocode_address, API_KEY, start)
+        end_latlong_request = executor.submit(geocode_address, API_KEY, end)
+
+        start_to_end_distance_matrix = start_to_end_request.result().get((0, 0))
+        if start_to_end_distance_matrix is None:
+            raise ValueError("No route found between the starting and ending locations.")
+        start_latlong = start_latlong_request.result()
+        end_latlong = end_latlong_request.result()
+        remaining_duration = duration
+        current_latlong = start_latlong
+        intermediate_latlongs = []
+        tried_addresses: set[str] = set()
+
+        # Check if ending location is reachable within the specified duration
+        if start_to_end_distance_matrix["duration_value"] > duration:
+            raise ValueError("Ending location not reachable within the specified duration.")
+
+        # Find latlongs of nearby places and plan the route, with the constants read once up front
+        average_speed = Constants.CONVERSION_FACTOR_MINUTES_TO_METERS / 60  # meters per second
+        maximum_speed = Constants.MAXIMUM_SPEED_METERS_PER_SECOND
+        max_search_radius = Constants.MAX_SEARCH_RADIUS_METERS
+        candidates_per_iteration = Constants.CANDIDATES_PER_ITERATION
+        min_hop_duration = Constants.MIN_HOP_DURATION_SECONDS
+        candidate_pool: list[dict[str, Any]] = []
+        pool_center = current_latlong
+        pool_radius = 0
+        for _ in range(Constants.MAX_PLAN_ITERATIONS):  # Bounds the API calls made for one plan
+            if remaining_duration < min_hop_duration:
+                break  # Not enough time left for another stop to be worthwhile
+
+            candidate_pool = [
+                place
+                for place in candidate_pool
+                if place["formatted_address"] not in tried_addresses
+            ]
+
+            # Only search again once the pool runs dry or we've moved away from where it was fetched
+            pool_is_fresh = (
+                not candidate_pool
+                or _haversine_vec(*pool_center, *current_latlong) > pool_radius / 2
+            )
+            if pool_is_fresh:
+                # Search for nearby places within the remaining duration
+                pool_center = current_latlong
+                pool_radius = int(min(remaining_duration * average_speed, max_search_radius))
+                candidate_pool = [
+                    place
+                    for place in search_nearby_places(API_KEY, pool_center, pool_radius)
+                    if place["latlong"]
+                    and place["formatted_address"]
+                    and place["formatted_address"] not in tried_addresses
+                ]
+
+            # Rule out places that can't fit even in a straight line at top speed
+            lats = np.fromiter(
+                (place["latlong"][0] for place in candidate_pool),
+                dtype=np.float64,
+                count=len(candidate_pool),
+            )
+            lngs = np.fromiter(
+                (place["latlong"][1] for place in candidate_pool),
+                dtype=np.float64,
+                count=len(candidate_pool),
+            )
+            distances_from_current = _haversine_vec(*current_latlong, lats, lngs)
+            distances_to_end = _haversine_vec(*end_latlong, lats, lngs)
+            reachable = (
+                distances_from_current + distances_to_end
+            ) / maximum_speed <= remaining_duration
+            for place, is_reachable in zip(candidate_pool, reachable):
+                if not is_reachable:
+                    tried_addresses.add(place["formatted_address"])  # Can only get further away
+
+            # Prefer places about halfway into the remaining duration, leaving time to carry on
+            scores = np.abs(distances_from_current / average_speed - remaining_duration / 2)
+            candidates = [
+                candidate_pool[index]
+                for index in heapq.nsmallest(
+                    candidates_per_iteration,
+                    np.flatnonzero(reachable),
+                    key=scores.__getitem__,
+                )
+            ]
+            if not candidates:
+                if pool_is_fresh:
+                    break  # Ran out of nearby places to search for
+                continue  # Search again from here, as the pool is now empty
+
+            # Time the legs to and onwards from every candidate. The matrix API bills every
+            # origin/destination pair, so two requests cost only the 2K + 1 legs used, where one
+            # (K + 1) x (K + 1) matrix would also bill every leg between the candidates themselves
+            candidate_latlongs = [place["latlong"] for place in candidates]
+            legs_from_current_request = executor.submit(
+                get_distance_matrix, API_KEY, [current_latlong], [*candidate_latlongs, end_latlong]
+            )
+            legs_to_end_request = executor.submit(
+                get_distance_matrix, API_KEY, candidate_latlongs, [end_latlong]
+            )
+            legs_from_current = legs_from_current_request.result()
+            legs_to_end = legs_to_end_request.result()
+
+            # A safety net: stops are only accepted when the leg from them to the end fits, so this
+            # only fires once traffic has slowed that leg since, for one extra element per step
+            leg_to_end_from_current = legs_from_current.get((0, len(candidates)))
+            if (
+                leg_to_end_from_current is not None
+                and leg_to_end_from_current["duration_value"] > remaining_duration
+            ):
+                break  # Can't make any detour when heading straight to the end doesn't fit
+
+            # Travel to the best-scored candidate that still leaves time to reach the end
+            for index, place in enumerate(candidates):
+                tried_addresses.add(place["formatted_address"])
+                leg_to_selection = legs_from_current.get((0, index))
+                leg_to_end = legs_to_end.get((index, 0))
+                if leg_to_selection is None or leg_to_end is None:
+                    continue  # No route to or onwards from this candidate
+
+                to_selection = leg_to_selection["duration_value"]
+                if to_selection + leg_to_end["duration_value"] <= remaining_duration:
+                    # Update the remaining duration and the route list
+                    remaining_duration -= to_selection
+                    intermediate_latlongs.append(place["latlong"])
+                    current_latlong = place["latlong"]
+                    break
 
             if len(intermediate_latlongs) == 8:
                 break  # Reached the maximum number of places before higher billing on API
-        else:
-            continue  # Try again with a different place
 
     if len(intermediate_latlongs) == 0:
         raise ValueError("No nearby places found within the specified duration.")
 
     # Calculate total route information
+    intermediate_latlongs = _order_waypoints(start_latlong, end_latlong, intermediate_latlongs)
     total_route_information = compute_route(
         API_KEY, start_latlong, end_latlong, intermediate_latlongs
     )
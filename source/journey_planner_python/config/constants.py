@@ -25,3 +25,24 @@ class Constants:
 
     # Computation constants
     CONVERSION_FACTOR_MINUTES_TO_METERS: int = 750  # meters per minute (just under 30mph)
+    CANDIDATES_PER_ITERATION: int = 4  # nearby places timed per planning step
+    MAX_SEARCH_RADIUS_METERS: int = 50000  # largest radius the Places API accepts
+    EARTH_RADIUS_METERS: int = 6371000
+    MAXIMUM_SPEED_METERS_PER_SECOND: float = 31.3  # 70mph, so straight-line times are a lower bound
+    WAYPOINT_ORDERING_MAX_PASSES: int = 50  # 2-opt passes before settling on a stop order
+    MAX_PLAN_ITERATIONS: int = 12  # planning steps before settling for the stops found so far
+    MIN_HOP_DURATION_SECONDS: int = 300  # remaining time below which no further stop is sought
+
+    # Network constants
+    HTTP_TIMEOUT_SECONDS: float = 15.0
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_MAX_CONNECTIONS: int = 16
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 8  # HTTP/2 multiplexes requests over these
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_RETRY_BACKOFF_FACTOR: float = 0.3  # seconds, doubled after each retry
+    HTTP_RETRY_STATUS_CODES: tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    # Caching constants
+    GEOCODE_CACHE_SIZE: int = 4096  # geocoded locations kept in memory
+    API_CACHE_SIZE: int = 1024  # distance matrix and route responses kept in memory
+    CACHE_COORDINATE_DECIMALS: int = 5  # ~1 metre, so nearby points share cached routes
@@ -1,39 +1,220 @@
 """google_maps.py: Integration with the Google Maps API."""
 
-import json
-from typing import Any, Literal
+from collections import OrderedDict
+from threading import Lock
+from time import sleep
+from typing import Any, Literal, Sequence
 
-import requests
+import httpx
+import orjson
 
+from ..config.constants import Constants
 from ..logs.setup_logging import setup_logging
 
 maps_integration_logger = setup_logging()
 
+# Shared HTTP/2 client, so every call reuses one pooled TLS connection per host
+_CLIENT = httpx.Client(
+    timeout=httpx.Timeout(
+        Constants.HTTP_TIMEOUT_SECONDS, connect=Constants.HTTP_CONNECT_TIMEOUT_SECONDS
+    ),
+    transport=httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=Constants.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=Constants.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        retries=Constants.HTTP_MAX_RETRIES,  # Only covers failed connections
+    ),
+)
+
+# In-memory LRU caches of API responses, so repeated lookups skip the network entirely
+_DISTANCE_MATRIX_CACHE: OrderedDict[tuple[Any, ...], dict[tuple[int, int], dict[str, Any]]] = (
+    OrderedDict()
+)
+_ROUTE_CACHE: OrderedDict[tuple[Any, ...], dict[str, Any]] = OrderedDict()
+_GEOCODE_CACHE: OrderedDict[str, tuple[float, float]] = OrderedDict()
+_CACHE_LOCK = Lock()
+
+
+# Static parts of every Routes API request, copied per call and patched with the route itself.
+# Nested values are replaced rather than mutated, so the shallow copies never alter these.
+_ROUTE_HEADERS_TEMPLATE = {"Content-Type": "application/json"}
+_ROUTE_PAYLOAD_SKELETON: dict[str, Any] = {
+    "intermediates": [],
+    "travelMode": "DRIVE",
+    "routingPreference": "TRAFFIC_AWARE",
+    "computeAlternativeRoutes": False,
+    "routeModifiers": {"avoidTolls": False, "avoidHighways": False, "avoidFerries": False},
+    "languageCode": "en-GB",
+    "units": "METRIC",
+}
+
+
+def _get_cached_result(cache: OrderedDict[Any, Any], key: Any) -> Any:
+    """
+    Look up an API result in a cache, marking it as the most recently used.
+
+    Parameters
+    ----------
+    cache : OrderedDict[Any, Any]
+        The cache to look the result up in.
+    key : Any
+        The key the result is stored under.
+
+    Returns
+    -------
+    Any
+        The cached result, or None if there isn't one.
+    """
+    with _CACHE_LOCK:
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+    return result
+
+
+def _cache_result(cache: OrderedDict[Any, Any], key: Any, result: Any, max_size: int) -> None:
+    """
+    Store an API result in a cache, evicting the least recently used entry once it is full.
+
+    Parameters
+    ----------
+    cache : OrderedDict[Any, Any]
+        The cache to store the result in.
+    key : Any
+        The key to store the result under.
+    result : Any
+        The result to store.
+    max_size : int
+        The most entries the cache may hold.
+    """
+    with _CACHE_LOCK:
+        cache[key] = result
+        cache.move_to_end(key)
+        if len(cache) > max_size:
+            cache.popitem(last=False)  # Hits move entries to the end, so the first is the stalest
+
+
+def _send_request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """
+    Send a request on the shared client, retrying rate-limited and server error responses.
+
+    Parameters
+    ----------
+    method : str
+        The HTTP method to use.
+    url : str
+        The URL to send the request to.
+    **kwargs : Any
+        Any other arguments to pass to httpx.Client.request.
+
+    Returns
+    -------
+    httpx.Response
+        The response, which may still be an error once the retries are used up.
+
+    Notes
+    -----
+    The client's transport only retries failed connections, so responses with
+    a status in Constants.HTTP_RETRY_STATUS_CODES are retried here, with the
+    wait doubling after each attempt.
+    """
+    response = _CLIENT.request(method, url, **kwargs)
+    for attempt in range(Constants.HTTP_MAX_RETRIES):
+        if response.status_code not in Constants.HTTP_RETRY_STATUS_CODES:
+            break
+        maps_integration_logger.debug(f"Retrying {url} after status {response.status_code}")
+        sleep(Constants.HTTP_RETRY_BACKOFF_FACTOR * 2**attempt)
+        response = _CLIENT.request(method, url, **kwargs)
+
+    return response
+
+
+def _round_latlong(latlong: tuple[float, float]) -> tuple[float, float]:
+    """
+    Round a latitude and longitude so nearby points share a cache key.
+
+    Parameters
+    ----------
+    latlong : tuple of float
+        The latitude and longitude to round.
+
+    Returns
+    -------
+    tuple of float
+        The rounded latitude and longitude.
+    """
+    return (
+        round(latlong[0], Constants.CACHE_COORDINATE_DECIMALS),
+        round(latlong[1], Constants.CACHE_COORDINATE_DECIMALS),
+    )
+
+
+def _normalize_location(location: str | tuple[float, float]) -> str | tuple[float, float]:
+    """
+    Normalize an address or latitude/longitude so equivalent locations share a cache key.
+
+    Parameters
+    ----------
+    location : str or tuple of float
+        The address or latitude and longitude to normalize.
+
+    Returns
+    -------
+    str or tuple of float
+        The stripped, lowercased address or the rounded latitude and longitude.
+    """
+    if isinstance(location, str):
+        return location.strip().lower()
+    return _round_latlong(location)
+
+
+def _format_location(location: str | tuple[float, float]) -> str:
+    """
+    Format an address or latitude/longitude for a Distance Matrix API request.
+
+    Parameters
+    ----------
+    location : str or tuple of float
+        The address or latitude and longitude to format.
+
+    Returns
+    -------
+    str
+        The address, or the latitude and longitude as 'lat,lng'.
+    """
+    if isinstance(location, str):
+        return location
+    return f"{location[0]},{location[1]}"
+
 
 def get_distance_matrix(
     api_key: str,
-    start_location: str,
-    end_location: str,
+    origins: Sequence[str | tuple[float, float]],
+    destinations: Sequence[str | tuple[float, float]],
     units: Literal["metric", "imperial"] = "metric",
-) -> dict[str, Any]:
+) -> dict[tuple[int, int], dict[str, Any]]:
     """
-    Retrieve the distance/duration between two locations using the Google Maps Distance Matrix API.
+    Retrieve the distances/durations between locations using the Google Maps Distance Matrix API.
 
     Parameters
     ----------
     api_key : str
         Your Google Maps API key.
-    start_location : str
-        The starting location for the distance matrix request.
-    end_location : str
-        The ending location for the distance matrix request.
+    origins : Sequence of str or tuple of float
+        The starting locations, as addresses or latitude/longitude pairs.
+    destinations : Sequence of str or tuple of float
+        The ending locations, as addresses or latitude/longitude pairs.
     units : Literal['metric', 'imperial'], optional
         The units to use for the distance and duration values, by default 'metric'.
 
     Returns
     -------
-    dict of str to str or int
-        A dictionary containing the distance and duration between the two locations.
+    dict of tuple of int to dict of str to str or int
+        A dictionary mapping each (origin index, destination index) pair to the
+        distance and duration between those two locations. Pairs with no route
+        between them are left out.
 
     Raises
     ------
@@ -43,60 +224,146 @@ def get_distance_matrix(
     Notes
     -----
     The Google Maps Distance Matrix API requires an API key with the appropriate permissions.
+    Every origin/destination pair is answered by a single request, which is billed per pair.
+    Results are cached in memory by normalized location, so repeated lookups skip the API.
 
     Example
     -------
     >>> api_key = 'your_api_key_here'
-    >>> start_location = 'London'
-    >>> end_location = 'Bury St Edmunds'
-    >>> get_distance_matrix(api_key, start_location, end_location)
+    >>> origins = ['London']
+    >>> destinations = ['Bury St Edmunds', (52.2053, 0.1218)]
+    >>> get_distance_matrix(api_key, origins, destinations)
     {
-        'start_location': 'London, UK',
-        'end_location': 'Bury St Edmunds, Bury Saint Edmunds, UK',
-        'distance_text': '133 km',
-        'distance_value': 133313,
-        'duration_text': '1 hour 47 mins',
-        'duration_value': 6398
+        (0, 0): {
+            'start_location': 'London, UK',
+            'end_location': 'Bury St Edmunds, Bury Saint Edmunds, UK',
+            'distance_text': '133 km',
+            'distance_value': 133313,
+            'duration_text': '1 hour 47 mins',
+            'duration_value': 6398
+        },
+        (0, 1): {
+            'start_location': 'London, UK',
+            'end_location': 'Cambridge CB2 3QJ, UK',
+            ...
+        }
     }
     """
-    url: str = (
-        f"https://maps.googleapis.com/maps/api/distancematrix/json?"
-        f"destinations={end_location}&origins={start_location}&units={units}&key={api_key}"
+    cache_key = (
+        tuple(_normalize_location(origin) for origin in origins),
+        tuple(_normalize_location(destination) for destination in destinations),
+        units,
     )
+    cached_result = _get_cached_result(_DISTANCE_MATRIX_CACHE, cache_key)
+    if cached_result is not None:
+        return {pair: dict(element) for pair, element in cached_result.items()}
+
+    url = "https://maps.googleapis.com/maps/api/distancematrix/json"
+    params = {
+        "origins": "|".join(_format_location(origin) for origin in origins),
+        "destinations": "|".join(_format_location(destination) for destination in destinations),
+        "units": units,
+        "key": api_key,
+    }
 
-    response = requests.get(url)
+    response = _send_request("GET", url, params=params)
     if response.status_code != 200:
         raise ValueError(f"API request failed with status code {response.status_code}")
 
-    data = response.json()
+    data = orjson.loads(response.content)
 
     if data["status"] != "OK":
         raise ValueError(f"API response status is not OK: {data['status']}")
 
     origin_addresses = data["origin_addresses"]
     destination_addresses = data["destination_addresses"]
-    elements = data["rows"][0]["elements"][0]
-
-    if elements["status"] != "OK":
-        raise ValueError(f"Element status is not OK: {elements['status']}")
-
-    result = {
-        "start_location": origin_addresses[0],
-        "end_location": destination_addresses[0],
-        "distance_text": elements["distance"]["text"],
-        "distance_value": elements["distance"]["value"],
-        "duration_text": elements["duration"]["text"],
-        "duration_value": elements["duration"]["value"],
-    }
 
-    return result
+    result = {}
+    for origin_index, row in enumerate(data["rows"]):
+        for destination_index, elements in enumerate(row["elements"]):
+            if elements["status"] != "OK":
+                maps_integration_logger.debug(
+                    f"Skipping {origin_addresses[origin_index]} to "
+                    f"{destination_addresses[destination_index]}: {elements['status']}"
+                )
+                continue
+
+            result[(origin_index, destination_index)] = {
+                "start_location": origin_addresses[origin_index],
+                "end_location": destination_addresses[destination_index],
+                "distance_text": elements["distance"]["text"],
+                "distance_value": elements["distance"]["value"],
+                "duration_text": elements["duration"]["text"],
+                "duration_value": elements["duration"]["value"],
+            }
+
+    _cache_result(_DISTANCE_MATRIX_CACHE, cache_key, result, Constants.API_CACHE_SIZE)
+
+    return {pair: dict(element) for pair, element in result.items()}
+
+
+def geocode_address(api_key: str, address: str) -> tuple[float, float]:
+    """
+    Find the latitude and longitude of an address using the Google Maps Geocoding API.
+
+    Parameters
+    ----------
+    api_key : str
+        Your Google Maps API key.
+    address : str
+        The address to geocode.
+
+    Returns
+    -------
+    tuple of float
+        The latitude and longitude of the address.
+
+    Raises
+    ------
+    ValueError
+        If the API request fails or if the address is not found.
+
+    Notes
+    -----
+    The Google Maps Geocoding API requires an API key with the appropriate permissions.
+    Results are cached in memory by normalized address, so repeated lookups skip the API.
+
+    Example
+    -------
+    >>> api_key = 'your_api_key_here'
+    >>> geocode_address(api_key, 'Bury St Edmunds')
+    (52.2429, 0.7105)
+    """
+    cache_key = address.strip().lower()
+    cached_latlong: tuple[float, float] | None = _get_cached_result(_GEOCODE_CACHE, cache_key)
+    if cached_latlong is not None:
+        return cached_latlong
+
+    url = "https://maps.googleapis.com/maps/api/geocode/json"
+    params = {"address": address, "key": api_key}
+
+    response = _send_request("GET", url, params=params)
+    if response.status_code != 200:
+        raise ValueError(f"API request failed with status code {response.status_code}")
+
+    data = orjson.loads(response.content)
+
+    if data["status"] != "OK":
+        raise ValueError(f"API response status is not OK: {data['status']}")
+
+    location = data["results"][0]["geometry"]["location"]
+    latlong = (location["lat"], location["lng"])
+
+    _cache_result(_GEOCODE_CACHE, cache_key, latlong, Constants.GEOCODE_CACHE_SIZE)
+
+    return latlong
 
 
 def search_nearby_places(
     api_key: str,
     latlong: tuple[float, float],
     radius: int,
-    types_list: list[str] = ["tourist_attraction"],
+    types_list: Sequence[str] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Search for nearby places using the Google Places API.
@@ -109,8 +376,8 @@ def search_nearby_places(
         The latitude and longitude of the search location.
     radius : int
         The radius of the search area in metres.
-    types_list : list of str, optional
-        A list of place types to include in the search. Default is ['tourist_attraction'].
+    types_list : Sequence of str, optional
+        The place types to include in the search. Default is None, meaning ('tourist_attraction',).
 
     Returns
     -------
@@ -125,6 +392,7 @@ def search_nearby_places(
     Notes
     -----
     The Google Places API requires an API key with the appropriate permissions.
+    A search with no matches returns an empty list.
 
     Example
     -------
@@ -138,13 +406,20 @@ def search_nearby_places(
             'formatted_address': 'West Midland Safari and Leisure Park, Bewdley DY12 1LF, UK',
             'rating': 4.5,
             'user_rating_count': 2,
-            'display_name': 'Twilight Cave'
+            'display_name': 'Twilight Cave',
+            'latlong': (52.3766, -2.2822)
         },
         ...
     ]
     """
+    if types_list is None:
+        types_list = ("tourist_attraction",)
+
     url = "https://places.googleapis.com/v1/places:searchNearby"
-    field_mask = "places.displayName,places.formattedAddress,places.rating,places.userRatingCount"
+    field_mask = (
+        "places.displayName,places.formattedAddress,places.rating,places.userRatingCount,"
+        "places.location"
+    )
     headers = {
         "Content-Type": "application/json",
         "X-Goog-Api-Key": api_key,
@@ -161,22 +436,27 @@ def search_nearby_places(
         "includedTypes": types_list,
     }
 
-    response = requests.post(url, headers=headers, data=json.dumps(payload))
+    response = _send_request("POST", url, headers=headers, content=orjson.dumps(payload))
     if response.status_code != 200:
         raise ValueError(f"API request failed with status code {response.status_code}")
 
-    data = response.json()
+    data = orjson.loads(response.content)
 
-    if "places" not in data:
-        raise ValueError(f"API response error: {data}")
+    if "error" in data:
+        raise ValueError(f"API response error: {data['error']}")
 
     places = []
-    for place in data["places"]:
+    for place in data.get("places", []):  # Left out altogether when nothing matches
         place_info = {
             "formatted_address": place.get("formattedAddress"),
             "rating": place.get("rating"),
             "user_rating_count": place.get("userRatingCount"),
             "display_name": place["displayName"]["text"] if "displayName" in place else None,
+            "latlong": (
+                (place["location"]["latitude"], place["location"]["longitude"])
+                if "location" in place
+                else None
+            ),
         }
         places.append(place_info)
 
@@ -187,7 +467,7 @@ def compute_route(
     api_key: str,
     origin_latlong: tuple[float, float],
     destination_latlong: tuple[float, float],
-    intermediate_latlongs: list[tuple[float, float]] = [],
+    intermediate_latlongs: list[tuple[float, float]] | None = None,
     travel_mode: str = "DRIVE",
     routing_preference: str = "TRAFFIC_AWARE",
     compute_alternative_routes: bool = False,
@@ -195,6 +475,7 @@ def compute_route(
     avoid_highways: bool = False,
     avoid_ferries: bool = False,
     units: Literal["IMPERIAL", "METRIC"] = "METRIC",
+    field_mask: str = "routes.duration,routes.distanceMeters,routes.polyline.encodedPolyline",
 ) -> dict[str, Any]:
     """
     Compute a route between two locations using the Google Routes API.
@@ -208,7 +489,7 @@ def compute_route(
     destination_latlong : tuple of float
         The latitude and longitude of the destination location.
     intermediate_latlongs : list of tuple of float, optional
-        A list of intermediate locations to visit along the route. Default is [].
+        A list of intermediate locations to visit along the route. Default is None.
     travel_mode : str, optional
         Mode of travel (e.g., 'DRIVE', 'WALK'). Default is 'DRIVE'.
     routing_preference : str, optional
@@ -225,11 +506,17 @@ def compute_route(
         Language code for the response. Default is 'en-US'.
     units : Literal['IMPERIAL', 'METRIC'], optional
         Units for the response. Default is 'METRIC'.
+    field_mask : str, optional
+        The route fields to request. Default is
+        'routes.duration,routes.distanceMeters,routes.polyline.encodedPolyline'.
+        Narrow it to e.g. 'routes.duration' when only the duration is needed,
+        as the polyline is the most expensive field to bill and transfer.
 
     Returns
     -------
     dict of str to int or str
         A dictionary containing the route distance, duration, and encoded polyline.
+        Fields left out of the field mask are None.
 
     Raises
     ------
@@ -239,6 +526,8 @@ def compute_route(
     Notes
     -----
     The Google Routes API requires an API key with the appropriate permissions.
+    Results are cached in memory, keyed on the route options and on coordinates
+    rounded to ~1 metre, so repeated lookups of nearby points skip the API.
 
     Example
     -------
@@ -254,42 +543,151 @@ def compute_route(
         'encoded_polyline': 'ipkcFfichVnP@j@BLoFVwM{E?'
     }
     """
-    url = "https://routes.googleapis.com/directions/v2:computeRoutes"
-    headers = {
-        "Content-Type": "application/json",
-        "X-Goog-Api-Key": api_key,
-        "X-Goog-FieldMask": "routes.duration,routes.distanceMeters,routes.polyline.encodedPolyline",
-    }  # Might also need to include 'routes.legs' in the field mask
-    payload = {
-        "origin": {
-            "location": {"latLng": {"latitude": origin_latlong[0], "longitude": origin_latlong[1]}}
-        },
-        "destination": {
-            "location": {
-                "latLng": {"latitude": destination_latlong[0], "longitude": destination_latlong[1]}
+    cache_key = (
+        _round_latlong(origin_latlong),
+        _round_latlong(destination_latlong),
+        tuple(_round_latlong(latlong) for latlong in intermediate_latlongs or ()),
+        travel_mode,
+        routing_preference,
+        compute_alternative_routes,
+        avoid_tolls,
+        avoid_highways,
+        avoid_ferries,
+        units,
+        field_mask,
+    )
+    cached_route_info = _get_cached_result(_ROUTE_CACHE, cache_key)
+    if cached_route_info is not None:
+        return dict(cached_route_info)
+
+    payload = _build_route_payload(
+        origin_latlong,
+        destination_latlong,
+        intermediate_latlongs,
+        travel_mode,
+        routing_preference,
+        compute_alternative_routes,
+        avoid_tolls,
+        avoid_highways,
+        avoid_ferries,
+        units,
+    )
+    route = _request_route(api_key, payload, field_mask)
+    route_info = {
+        "distance_meters": route.get("distanceMeters"),
+        "duration_seconds": int(route["duration"][:-1]) if "duration" in route else None,
+        "encoded_polyline": route.get("polyline", {}).get("encodedPolyline"),
+    }
+
+    _cache_result(_ROUTE_CACHE, cache_key, route_info, Constants.API_CACHE_SIZE)
+
+    return dict(route_info)
+
+
+def _build_route_payload(
+    origin_latlong: tuple[float, float],
+    destination_latlong: tuple[float, float],
+    intermediate_latlongs: list[tuple[float, float]] | None,
+    travel_mode: str,
+    routing_preference: str,
+    compute_alternative_routes: bool,
+    avoid_tolls: bool,
+    avoid_highways: bool,
+    avoid_ferries: bool,
+    units: Literal["IMPERIAL", "METRIC"],
+) -> dict[str, Any]:
+    """
+    Build the request body for a Google Routes API computeRoutes request.
+
+    Parameters
+    ----------
+    origin_latlong : tuple of float
+        The latitude and longitude of the origin location.
+    destination_latlong : tuple of float
+        The latitude and longitude of the destination location.
+    intermediate_latlongs : list of tuple of float or None
+        A list of intermediate locations to visit along the route.
+    travel_mode : str
+        Mode of travel (e.g., 'DRIVE', 'WALK').
+    routing_preference : str
+        Routing preference (e.g., 'TRAFFIC_AWARE').
+    compute_alternative_routes : bool
+        Whether to compute alternative routes.
+    avoid_tolls : bool
+        Whether to avoid tolls.
+    avoid_highways : bool
+        Whether to avoid highways.
+    avoid_ferries : bool
+        Whether to avoid ferries.
+    units : Literal['IMPERIAL', 'METRIC']
+        Units for the response.
+
+    Returns
+    -------
+    dict of str to Any
+        The request body.
+    """
+    payload = _ROUTE_PAYLOAD_SKELETON.copy()
+    payload["origin"] = {
+        "location": {"latLng": {"latitude": origin_latlong[0], "longitude": origin_latlong[1]}}
+    }
+    payload["destination"] = {
+        "location": {
+            "latLng": {"latitude": destination_latlong[0], "longitude": destination_latlong[1]}
+        }
+    }
+
+    if intermediate_latlongs:
+        intermediates: list[Any] = [None] * len(intermediate_latlongs)
+        for index, latlong in enumerate(intermediate_latlongs):
+            intermediates[index] = {
+                "location": {"latLng": {"latitude": latlong[0], "longitude": latlong[1]}}
             }
-        },
-        "intermediates": (
-            [
-                {"location": {"latLng": {"latitude": latlong[0], "longitude": latlong[1]}}}
-                for latlong in intermediate_latlongs
-            ]
-            if intermediate_latlongs != []
-            else []
-        ),
-        "travelMode": travel_mode,
-        "routingPreference": routing_preference,
-        "computeAlternativeRoutes": compute_alternative_routes,
-        "routeModifiers": {
+        payload["intermediates"] = intermediates
+
+    payload["travelMode"] = travel_mode
+    payload["routingPreference"] = routing_preference
+    payload["computeAlternativeRoutes"] = compute_alternative_routes
+    payload["units"] = units
+    if avoid_tolls or avoid_highways or avoid_ferries:
+        payload["routeModifiers"] = {
             "avoidTolls": avoid_tolls,
             "avoidHighways": avoid_highways,
             "avoidFerries": avoid_ferries,
-        },
-        "languageCode": "en-GB",
-        "units": units,
-    }
+        }
+
+    return payload
+
 
-    response = requests.post(url, headers=headers, data=json.dumps(payload))
+def _request_route(api_key: str, payload: dict[str, Any], field_mask: str) -> dict[str, Any]:
+    """
+    Send a Google Routes API computeRoutes request and return the first route.
+
+    Parameters
+    ----------
+    api_key : str
+        Your Google Maps API key.
+    payload : dict of str to Any
+        The request body.
+    field_mask : str
+        The route fields to request.
+
+    Returns
+    -------
+    dict of str to Any
+        The first route in the response.
+
+    Raises
+    ------
+    ValueError
+        If the API request fails or if the response contains an error.
+    """
+    url = "https://routes.googleapis.com/directions/v2:computeRoutes"
+    headers = _ROUTE_HEADERS_TEMPLATE.copy()
+    headers["X-Goog-Api-Key"] = api_key
+    headers["X-Goog-FieldMask"] = field_mask  # Might also need to include 'routes.legs'
+
+    response = _send_request("POST", url, headers=headers, content=orjson.dumps(payload))
     if response.status_code != 200:
         if response.status_code == 403:
             raise ValueError(
@@ -302,16 +700,10 @@ def compute_route(
                 f"API request failed with status code {response.status_code}: {response.text}"
             )
 
-    data = response.json()
+    data = orjson.loads(response.content)
 
     if "routes" not in data or not data["routes"]:
         raise ValueError(f"API response error: {data}")
 
-    route: dict = data["routes"][0]
-    route_info = {
-        "distance_meters": route.get("distanceMeters"),
-        "duration_seconds": int(route.get("duration", "0").replace("s", "")),
-        "encoded_polyline": route.get("polyline", {}).get("encodedPolyline"),
-    }
-
-    return route_info
+    route: dict[str, Any] = data["routes"][0]
+    return route
@@ -1,25 +1,24 @@
 """command_line.py: Command line interface for the application."""
 
-from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
-from typing import Any
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser, Namespace
 
 from ..logs.setup_logging import setup_logging
 
 interface_logger = setup_logging()
 
 
-def command_line_interface() -> dict[str, Any]:
+def command_line_interface() -> Namespace:
     """
     Command line interface for the application.
 
     Returns
     -------
-    dict[str, Any]
-        A dictionary containing the arguments passed to the application
+    Namespace
+        A namespace containing the arguments passed to the application
 
     Notes
     -----
-    Takes arguments from the command line and returns them as a dictionary.
+    Takes arguments from the command line and returns them as a namespace.
     """
     interface_logger.debug("Command line interface started.")
 
@@ -70,6 +69,7 @@ def command_line_interface() -> dict[str, Any]:
         "--duration",
         "-d",
         action="store",
+        dest="duration_minutes",
         type=int,
         required=True,
         help="Duration of the journey in minutes.",
@@ -79,4 +79,4 @@ def command_line_interface() -> dict[str, Any]:
 
     interface_logger.debug("Command line interface finished.")
 
-    return vars(parsed_args)
+    return parsed_args
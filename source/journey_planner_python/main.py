@@ -19,10 +19,10 @@ def main() -> None:
 
     user_arguments = command_line_interface()
     route_details = plan_route(
-        user_arguments["start"],
-        user_arguments["end"],
-        user_arguments["duration"] * 60,  # Convert minutes to seconds
-        user_arguments["API_KEY"],
+        user_arguments.start,
+        user_arguments.end or user_arguments.start,  # No end means a return journey
+        user_arguments.duration_minutes * 60,  # Convert minutes to seconds
+        user_arguments.api_key,
     )
 
     print(
@@ -0,0 +1,340 @@
+"""test_google_maps.py: Tests for the Google Maps API integration."""
+
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+import pytest
+from journey_planner_python.config.constants import Constants
+from journey_planner_python.integrations import google_maps
+
+DISTANCE_MATRIX_BODY = {
+    "status": "OK",
+    "origin_addresses": ["London, UK"],
+    "destination_addresses": ["Bury St Edmunds, UK", "Reykjavik, Iceland"],
+    "rows": [
+        {
+            "elements": [
+                {
+                    "status": "OK",
+                    "distance": {"text": "133 km", "value": 133313},
+                    "duration": {"text": "1 hour 47 mins", "value": 6398},
+                },
+                {"status": "ZERO_RESULTS"},
+            ]
+        }
+    ],
+}
+
+
+@pytest.fixture
+def distance_matrix_requests(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    """
+    Replace the Distance Matrix API with a canned response.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The keyword arguments of every request sent, in order.
+
+    Notes
+    -----
+    One origin and two destinations, where the second pair has no route
+    between them. The cache is cleared so each test sends its request.
+    """
+    sent: list[dict[str, Any]] = []
+
+    def send_request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+        sent.append(kwargs)
+        return httpx.Response(200, json=DISTANCE_MATRIX_BODY)
+
+    monkeypatch.setattr(google_maps, "_send_request", send_request)
+    monkeypatch.setattr(google_maps, "_DISTANCE_MATRIX_CACHE", OrderedDict())
+    return sent
+
+
+def test_get_distance_matrix_parses_elements(
+    distance_matrix_requests: list[dict[str, Any]],
+) -> None:
+    """
+    Test that each element is keyed by its origin and destination indices.
+
+    Parameters
+    ----------
+    distance_matrix_requests : list[dict[str, Any]]
+        The requests sent to the canned Distance Matrix API.
+    """
+    result = google_maps.get_distance_matrix("key", ["London"], ["Bury St Edmunds", (64.1, -21.9)])
+
+    assert result[(0, 0)] == {
+        "start_location": "London, UK",
+        "end_location": "Bury St Edmunds, UK",
+        "distance_text": "133 km",
+        "distance_value": 133313,
+        "duration_text": "1 hour 47 mins",
+        "duration_value": 6398,
+    }
+    assert distance_matrix_requests[0]["params"]["destinations"] == "Bury St Edmunds|64.1,-21.9"
+
+
+def test_get_distance_matrix_skips_pairs_without_a_route(
+    distance_matrix_requests: list[dict[str, Any]],
+) -> None:
+    """
+    Test that elements whose status is not OK are left out.
+
+    Parameters
+    ----------
+    distance_matrix_requests : list[dict[str, Any]]
+        The requests sent to the canned Distance Matrix API.
+    """
+    result = google_maps.get_distance_matrix("key", ["London"], ["Bury St Edmunds", (64.1, -21.9)])
+
+    assert list(result) == [(0, 0)]
+
+
+def test_get_distance_matrix_caches_results(
+    distance_matrix_requests: list[dict[str, Any]],
+) -> None:
+    """
+    Test that a repeated lookup of equivalent locations skips the API.
+
+    Parameters
+    ----------
+    distance_matrix_requests : list[dict[str, Any]]
+        The requests sent to the canned Distance Matrix API.
+    """
+    first = google_maps.get_distance_matrix("key", ["London"], ["Bury St Edmunds", (64.1, -21.9)])
+    first[(0, 0)]["duration_value"] = 0  # Callers mutating a result mustn't alter the cache
+    second = google_maps.get_distance_matrix(
+        "key", [" london "], ["bury st edmunds", (64.1000001, -21.9)]
+    )
+
+    assert len(distance_matrix_requests) == 1
+    assert second[(0, 0)]["duration_value"] == 6398
+
+
+def test_get_distance_matrix_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch, distance_matrix_requests: list[dict[str, Any]]
+) -> None:
+    """
+    Test that a full cache drops the result that has gone unused the longest.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    distance_matrix_requests : list[dict[str, Any]]
+        The requests sent to the canned Distance Matrix API.
+
+    Notes
+    -----
+    London is looked up again just before the cache overflows, so it is
+    Cambridge's result that gets evicted, even though it was stored later.
+    """
+    monkeypatch.setattr(Constants, "API_CACHE_SIZE", 2)
+
+    for destination in ("London", "Cambridge", "London", "Ipswich", "London", "Cambridge"):
+        google_maps.get_distance_matrix("key", ["Bury St Edmunds"], [destination])
+
+    sent_destinations = [request["params"]["destinations"] for request in distance_matrix_requests]
+    assert sent_destinations == ["London", "Cambridge", "Ipswich", "Cambridge"]
+
+
+def test_geocode_address_cache_is_bounded_separately(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that geocoded addresses are evicted at their own cache size.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+
+    Notes
+    -----
+    The API response cache size is set smaller, so the test fails if the
+    geocode cache is bounded by it instead.
+    """
+    body = {"status": "OK", "results": [{"geometry": {"location": {"lat": 52.2, "lng": 0.7}}}]}
+    monkeypatch.setattr(
+        google_maps, "_send_request", lambda method, url, **kwargs: httpx.Response(200, json=body)
+    )
+    monkeypatch.setattr(google_maps, "_GEOCODE_CACHE", OrderedDict())
+    monkeypatch.setattr(Constants, "GEOCODE_CACHE_SIZE", 2)
+    monkeypatch.setattr(Constants, "API_CACHE_SIZE", 1)
+
+    for address in ("London", "Cambridge", "Ipswich"):
+        google_maps.geocode_address("key", address)
+
+    assert list(google_maps._GEOCODE_CACHE) == ["cambridge", "ipswich"]
+
+
+def test_get_distance_matrix_raises_on_error_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that a response with a status other than OK raises a ValueError.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(
+        google_maps,
+        "_send_request",
+        lambda method, url, **kwargs: httpx.Response(200, json={"status": "REQUEST_DENIED"}),
+    )
+    monkeypatch.setattr(google_maps, "_DISTANCE_MATRIX_CACHE", OrderedDict())
+
+    with pytest.raises(ValueError, match="REQUEST_DENIED"):
+        google_maps.get_distance_matrix("key", ["London"], ["Cambridge"])
+
+
+def test_search_nearby_places_without_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that a search with no matches returns no places rather than failing.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+
+    Notes
+    -----
+    The Places API leaves the places key out of the response altogether
+    when nothing matches.
+    """
+    monkeypatch.setattr(
+        google_maps, "_send_request", lambda method, url, **kwargs: httpx.Response(200, json={})
+    )
+
+    assert google_maps.search_nearby_places("key", (52.2, 0.7), 1000) == []
+
+
+def test_search_nearby_places_raises_on_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that a response carrying an error raises a ValueError.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(
+        google_maps,
+        "_send_request",
+        lambda method, url, **kwargs: httpx.Response(
+            200, json={"error": {"code": 400, "status": "INVALID_ARGUMENT"}}
+        ),
+    )
+
+    with pytest.raises(ValueError, match="INVALID_ARGUMENT"):
+        google_maps.search_nearby_places("key", (52.2, 0.7), 1000)
+
+
+def test_compute_route_leaves_unrequested_fields_as_none(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that fields left out of the field mask come back as None.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(
+        google_maps,
+        "_send_request",
+        lambda method, url, **kwargs: httpx.Response(
+            200, json={"routes": [{"distanceMeters": 772}]}
+        ),
+    )
+    monkeypatch.setattr(google_maps, "_ROUTE_CACHE", OrderedDict())
+
+    route = google_maps.compute_route(
+        "key",
+        (37.419734, -122.0827784),
+        (37.41767, -122.079595),
+        field_mask="routes.distanceMeters",
+    )
+
+    assert route == {"distance_meters": 772, "duration_seconds": None, "encoded_polyline": None}
+
+
+def test_compute_route_parses_duration(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the duration string is parsed into whole seconds.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(
+        google_maps,
+        "_send_request",
+        lambda method, url, **kwargs: httpx.Response(200, json={"routes": [{"duration": "165s"}]}),
+    )
+    monkeypatch.setattr(google_maps, "_ROUTE_CACHE", OrderedDict())
+
+    route = google_maps.compute_route(
+        "key", (37.419734, -122.0827784), (37.41767, -122.079595), field_mask="routes.duration"
+    )
+
+    assert route["duration_seconds"] == 165
+
+
+def test_send_request_retries_server_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that a server error is retried after a backoff.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    """
+    responses = iter([httpx.Response(503), httpx.Response(200)])
+    waits: list[float] = []
+    monkeypatch.setattr(google_maps._CLIENT, "request", lambda *args, **kwargs: next(responses))
+    monkeypatch.setattr(google_maps, "sleep", waits.append)
+
+    response = google_maps._send_request("GET", "https://maps.googleapis.com")
+
+    assert response.status_code == 200
+    assert waits == [Constants.HTTP_RETRY_BACKOFF_FACTOR]
+
+
+def test_send_request_gives_up_after_max_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the last error response is returned once the retries are used up.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+
+    Notes
+    -----
+    The wait before each retry should double, starting from the backoff factor.
+    """
+    attempts: list[str] = []
+    waits: list[float] = []
+
+    def request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+        attempts.append(method)
+        return httpx.Response(503)
+
+    monkeypatch.setattr(google_maps._CLIENT, "request", request)
+    monkeypatch.setattr(google_maps, "sleep", waits.append)
+
+    response = google_maps._send_request("GET", "https://maps.googleapis.com")
+
+    assert response.status_code == 503
+    assert len(attempts) == Constants.HTTP_MAX_RETRIES + 1
+    assert waits == [
+        Constants.HTTP_RETRY_BACKOFF_FACTOR * 2**attempt
+        for attempt in range(Constants.HTTP_MAX_RETRIES)
+    ]
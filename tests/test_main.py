@@ -1,15 +1,63 @@
 """test_main.py: Tests for the main entry point of the application."""
 
+from argparse import Namespace
+from typing import Any
 
-def test_run_main() -> None:
+import pytest
+from journey_planner_python import main as main_module
+from journey_planner_python.interface.command_line import command_line_interface
+
+
+def test_command_line_interface_returns_namespace(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the parsed arguments come back as a namespace.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(
+        "sys.argv", ["journey_planner_python", "-a", "key", "-s", "London", "-d", "90"]
+    )
+
+    user_arguments = command_line_interface()
+
+    assert isinstance(user_arguments, Namespace)
+    assert user_arguments.api_key == "key"
+    assert user_arguments.start == "London"
+    assert user_arguments.end is None
+    assert user_arguments.duration_minutes == 90
+
+
+def test_run_main(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
     """
     Test the main entry point of the application.
 
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    capsys : pytest.CaptureFixture[str]
+        The pytest fixture capturing printed output.
+
     Notes
     -----
-    This function tests the main entry point of the application.
-    It is responsible for testing the application, taking in
-    user input, and generating the project. It does not return
-    anything.
+    With no ending location given, the journey should return to the
+    starting location, and the duration should be passed on in seconds.
     """
-    assert True  # TODO: Implement tests
+    plan_route_calls: list[tuple[Any, ...]] = []
+
+    def plan_route(*args: Any) -> dict[str, Any]:
+        plan_route_calls.append(args)
+        return {"distance_meters": 772, "duration_seconds": 165, "encoded_polyline": "abc"}
+
+    monkeypatch.setattr(main_module, "plan_route", plan_route)
+    monkeypatch.setattr(
+        "sys.argv", ["journey_planner_python", "-a", "key", "-s", "London", "-d", "90"]
+    )
+
+    main_module.main()
+
+    assert plan_route_calls == [("London", "London", 5400, "key")]
+    assert "Duration: 165 seconds" in capsys.readouterr().out
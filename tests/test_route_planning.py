@@ -0,0 +1,517 @@
+"""test_route_planning.py: Tests for the route planning helpers."""
+
+from math import pi
+from typing import Any, Callable, Sequence
+
+import numpy as np
+import pytest
+from journey_planner_python.computation import route_planning
+from journey_planner_python.computation.route_planning import (
+    _haversine_vec,
+    _order_waypoints,
+    plan_route,
+)
+from journey_planner_python.config.constants import Constants
+
+SPEED_METERS_PER_SECOND = 20.0  # Below the planner's top speed, so its straight-line bound holds
+ADDRESSES = {"Bury St Edmunds": (52.2429, 0.7105), "Cambridge": (52.1951, 0.1313)}
+START = ADDRESSES["Bury St Edmunds"]
+
+
+def _north_of(latlong: tuple[float, float], kilometers: float) -> tuple[float, float]:
+    """
+    Find the point a given distance due north of another.
+
+    Parameters
+    ----------
+    latlong : tuple[float, float]
+        The latitude and longitude to start from.
+    kilometers : float
+        How far north to go.
+
+    Returns
+    -------
+    tuple[float, float]
+        The latitude and longitude of the point.
+    """
+    return latlong[0] + kilometers / (Constants.EARTH_RADIUS_METERS * pi / 180_000), latlong[1]
+
+
+def _place(name: str, latlong: tuple[float, float]) -> dict[str, Any]:
+    """
+    Build a place as search_nearby_places returns it.
+
+    Parameters
+    ----------
+    name : str
+        The address of the place.
+    latlong : tuple[float, float]
+        The latitude and longitude of the place.
+
+    Returns
+    -------
+    dict[str, Any]
+        The place.
+    """
+    return {
+        "formatted_address": name,
+        "rating": None,
+        "user_rating_count": None,
+        "display_name": name,
+        "latlong": latlong,
+    }
+
+
+class FakeMaps:
+    """
+    Stand-ins for the Google Maps API, where every trip is a straight line at a steady speed.
+
+    Attributes
+    ----------
+    search : Callable[[tuple[float, float]], list[dict[str, Any]]]
+        Finds the places around a point. By default, every search finds `places`.
+    places : list[dict[str, Any]]
+        The places found by the default search.
+    slow_latlongs : dict[tuple[float, float], float]
+        How many times slower legs to or from these points are, e.g. due to traffic.
+    drift : float
+        How many times slower legs timed while planning are than those timed up front.
+    searches : list[tuple[tuple[float, float], int]]
+        The centre and radius of every search, in order.
+    timed : list[list[tuple[float, float]]]
+        The candidates timed at each planning step, in order.
+    routes : list[list[tuple[float, float]]]
+        The stops of every route computed, in order.
+    """
+
+    def __init__(self) -> None:
+        """Start with no places, no traffic, and nothing recorded."""
+        self.places: list[dict[str, Any]] = []
+        self.search: Callable[[tuple[float, float]], list[dict[str, Any]]] = lambda _: [
+            dict(place) for place in self.places
+        ]
+        self.slow_latlongs: dict[tuple[float, float], float] = {}
+        self.drift = 1.0
+        self.searches: list[tuple[tuple[float, float], int]] = []
+        self.timed: list[list[tuple[float, float]]] = []
+        self.routes: list[list[tuple[float, float]]] = []
+
+    def _duration(self, origin: tuple[float, float], destination: tuple[float, float]) -> int:
+        """
+        Time a leg.
+
+        Parameters
+        ----------
+        origin : tuple[float, float]
+            The latitude and longitude of the start of the leg.
+        destination : tuple[float, float]
+            The latitude and longitude of the end of the leg.
+
+        Returns
+        -------
+        int
+            The duration of the leg, in seconds.
+        """
+        distance = _haversine_vec(*origin, [destination[0]], [destination[1]])[0]
+        slowdown = max(
+            self.slow_latlongs.get(origin, 1.0), self.slow_latlongs.get(destination, 1.0)
+        )
+        return int(distance / SPEED_METERS_PER_SECOND * slowdown)
+
+    def get_distance_matrix(
+        self,
+        api_key: str,
+        origins: Sequence[str | tuple[float, float]],
+        destinations: Sequence[str | tuple[float, float]],
+    ) -> dict[tuple[int, int], dict[str, Any]]:
+        """
+        Time every leg from the origins to the destinations.
+
+        Parameters
+        ----------
+        api_key : str
+            Ignored.
+        origins : Sequence[str | tuple[float, float]]
+            The addresses or latitudes and longitudes to start from.
+        destinations : Sequence[str | tuple[float, float]]
+            The addresses or latitudes and longitudes to go to.
+
+        Returns
+        -------
+        dict[tuple[int, int], dict[str, Any]]
+            The duration of each leg, keyed by origin and destination index.
+
+        Notes
+        -----
+        Legs between addresses are the up-front check of the whole journey.
+        Each planning step times the legs from the current point to its
+        candidates and the end, which is recorded, and from its candidates
+        to the end.
+        """
+        origin_latlongs = [ADDRESSES[o] if isinstance(o, str) else o for o in origins]
+        destination_latlongs = [ADDRESSES[d] if isinstance(d, str) else d for d in destinations]
+        drift = 1.0
+        if not isinstance(origins[0], str):
+            drift = self.drift
+            if len(destinations) > 1:
+                self.timed.append(destination_latlongs[:-1])
+        return {
+            (i, j): {"duration_value": int(self._duration(origin, destination) * drift)}
+            for i, origin in enumerate(origin_latlongs)
+            for j, destination in enumerate(destination_latlongs)
+        }
+
+    def search_nearby_places(
+        self, api_key: str, latlong: tuple[float, float], radius: int
+    ) -> list[dict[str, Any]]:
+        """
+        Find the places around a point.
+
+        Parameters
+        ----------
+        api_key : str
+            Ignored.
+        latlong : tuple[float, float]
+            The latitude and longitude to search around.
+        radius : int
+            The radius to search within, in metres.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The places found.
+        """
+        self.searches.append((latlong, radius))
+        return self.search(latlong)
+
+    def geocode_address(self, api_key: str, address: str) -> tuple[float, float]:
+        """
+        Find the latitude and longitude of an address.
+
+        Parameters
+        ----------
+        api_key : str
+            Ignored.
+        address : str
+            One of the known addresses.
+
+        Returns
+        -------
+        tuple[float, float]
+            The latitude and longitude of the address.
+        """
+        return ADDRESSES[address]
+
+    def compute_route(
+        self,
+        api_key: str,
+        origin_latlong: tuple[float, float],
+        destination_latlong: tuple[float, float],
+        intermediate_latlongs: list[tuple[float, float]],
+    ) -> dict[str, Any]:
+        """
+        Compute the final route.
+
+        Parameters
+        ----------
+        api_key : str
+            Ignored.
+        origin_latlong : tuple[float, float]
+            The latitude and longitude of the start of the route.
+        destination_latlong : tuple[float, float]
+            The latitude and longitude of the end of the route.
+        intermediate_latlongs : list[tuple[float, float]]
+            The stops along the route, in order.
+
+        Returns
+        -------
+        dict[str, Any]
+            The route information.
+        """
+        self.routes.append(intermediate_latlongs)
+        return {"distance_meters": 0, "duration_seconds": 0, "encoded_polyline": ""}
+
+
+@pytest.fixture
+def fake_maps(monkeypatch: pytest.MonkeyPatch) -> FakeMaps:
+    """
+    Plan routes against a fake Google Maps API.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+
+    Returns
+    -------
+    FakeMaps
+        The fake API, to set up places on and inspect the calls made to.
+    """
+    fake = FakeMaps()
+    for name in ("get_distance_matrix", "search_nearby_places", "geocode_address", "compute_route"):
+        monkeypatch.setattr(route_planning, name, getattr(fake, name))
+    return fake
+
+
+def _search_one_new_place(fake_maps: FakeMaps) -> None:
+    """
+    Make every search find a single, new place 1 km north of where it searches.
+
+    Parameters
+    ----------
+    fake_maps : FakeMaps
+        The fake API to set the search on.
+    """
+    fake_maps.search = lambda latlong: [
+        _place(f"Place {len(fake_maps.searches)}", _north_of(latlong, 1))
+    ]
+
+
+def test_haversine_vec_same_point_is_zero() -> None:
+    """
+    Test that the distance from a point to itself is zero.
+
+    Notes
+    -----
+    A candidate at the current location must never look further away
+    than it is, or it could be wrongly ruled out.
+    """
+    distances = _haversine_vec(52.2, 0.7, [52.2], [0.7])
+
+    assert distances.tolist() == [0.0]
+
+
+def test_haversine_vec_one_degree_of_latitude() -> None:
+    """
+    Test the distance along one degree of a meridian.
+
+    Notes
+    -----
+    One degree of latitude is an arc of pi / 180 radians, so its length
+    is exactly that fraction of the Earth's radius.
+    """
+    distances = _haversine_vec(0.0, 0.0, [1.0], [0.0])
+
+    assert distances[0] == pytest.approx(Constants.EARTH_RADIUS_METERS * pi / 180)
+
+
+def test_haversine_vec_is_vectorized() -> None:
+    """
+    Test that one call measures the distance to every point given.
+
+    Notes
+    -----
+    Checks the result lines up with the inputs, and against a known
+    distance: London to Paris is about 344 km.
+    """
+    lats = np.array([51.5074, 48.8566, 51.5074])
+    lngs = np.array([-0.1278, 2.3522, -0.1278])
+
+    distances = _haversine_vec(51.5074, -0.1278, lats, lngs)
+
+    assert distances.shape == (3,)
+    assert distances[0] == pytest.approx(0.0)
+    assert distances[1] == pytest.approx(343_500, rel=0.01)
+    assert distances[2] == pytest.approx(0.0)
+
+
+def test_order_waypoints_without_waypoints() -> None:
+    """Test that a route with no stops is left with no stops."""
+    assert _order_waypoints((52.0, 0.0), (52.3, 0.0), []) == []
+
+
+def test_order_waypoints_with_one_waypoint() -> None:
+    """Test that a single stop is returned as it is."""
+    assert _order_waypoints((52.0, 0.0), (52.3, 0.0), [(52.1, 0.1)]) == [(52.1, 0.1)]
+
+
+def test_order_waypoints_uncrosses_path() -> None:
+    """
+    Test that a path crossing over itself is reordered so it no longer does.
+
+    Notes
+    -----
+    Visiting the further stop first makes the legs out of the start and
+    into the end cross, so the stops should come back swapped.
+    """
+    start, end = (0.0, 0.0), (0.0, 0.3)
+    waypoints = [(0.1, 0.2), (0.1, 0.1)]
+
+    assert _order_waypoints(start, end, waypoints) == [(0.1, 0.1), (0.1, 0.2)]
+
+
+def test_order_waypoints_keeps_shortest_order() -> None:
+    """Test that stops already in their shortest order are not moved."""
+    start, end = (52.0, 0.0), (52.0, 0.5)
+    waypoints = [(52.0, 0.1), (52.0, 0.2), (52.0, 0.3), (52.0, 0.4)]
+
+    assert _order_waypoints(start, end, waypoints) == waypoints
+
+
+def test_plan_route_keeps_pool_until_it_runs_dry(fake_maps: FakeMaps) -> None:
+    """
+    Test that nearby places are only searched for again once every one has been tried.
+
+    Parameters
+    ----------
+    fake_maps : FakeMaps
+        The fake Google Maps API.
+    """
+    nearby = [_north_of(START, kilometers) for kilometers in (1, 2, 3)]
+    fake_maps.places = [_place(f"Place {index}", latlong) for index, latlong in enumerate(nearby)]
+
+    plan_route("Bury St Edmunds", "Bury St Edmunds", 3600, "key")
+
+    assert sorted(fake_maps.routes[0]) == nearby
+    assert [center for center, _ in fake_maps.searches] == [START, fake_maps.routes[0][-1]]
+
+
+def test_plan_route_searches_again_once_route_moves_away(fake_maps: FakeMaps) -> None:
+    """
+    Test that nearby places are searched for again after moving over half the radius away.
+
+    Parameters
+    ----------
+    fake_maps : FakeMaps
+        The fake Google Maps API.
+
+    Notes
+    -----
+    The first stop is 41 km away, over half the 50 km search radius, so
+    the next step searches again even though the pool isn't empty yet.
+    """
+    far, further = _north_of(START, 40), _north_of(START, 41)
+    fake_maps.places = [_place("Far", far), _place("Further", further)]
+
+    plan_route("Bury St Edmunds", "Bury St Edmunds", 7200, "key")
+
+    (first_center, first_radius), (second_center, _) = fake_maps.searches[:2]
+    assert first_center == START and first_radius == Constants.MAX_SEARCH_RADIUS_METERS
+    assert second_center == further
+    assert fake_maps.timed[1] == [far]
+
+
+def test_plan_route_never_times_ruled_out_or_rejected_places_again(
+    monkeypatch: pytest.MonkeyPatch, fake_maps: FakeMaps
+) -> None:
+    """
+    Test that places ruled out or rejected once are never timed again.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    fake_maps : FakeMaps
+        The fake Google Maps API.
+
+    Notes
+    -----
+    The unreachable place is too far to get to and back even in a
+    straight line at top speed, so it is never timed. Traffic makes the
+    jammed place too slow to get to, so it is rejected at the first step
+    and isn't timed again at the second.
+    """
+    monkeypatch.setattr(Constants, "CANDIDATES_PER_ITERATION", 2)
+    jammed, unreachable = _north_of(START, 3), _north_of(START, 300)
+    fake_maps.places = [
+        _place("Jammed", jammed),
+        _place("Near", _north_of(START, 2)),
+        _place("Nearest", _north_of(START, 1)),
+        _place("Unreachable", unreachable),
+    ]
+    fake_maps.slow_latlongs[jammed] = 100
+
+    plan_route("Bury St Edmunds", "Bury St Edmunds", 3600, "key")
+
+    assert len(fake_maps.timed) == 2
+    assert jammed in fake_maps.timed[0] and jammed not in fake_maps.timed[1]
+    assert all(unreachable not in step for step in fake_maps.timed)
+
+
+def test_plan_route_stops_at_iteration_cap(
+    monkeypatch: pytest.MonkeyPatch, fake_maps: FakeMaps
+) -> None:
+    """
+    Test that planning stops after the maximum number of steps.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    fake_maps : FakeMaps
+        The fake Google Maps API.
+    """
+    monkeypatch.setattr(Constants, "MAX_PLAN_ITERATIONS", 2)
+    _search_one_new_place(fake_maps)
+
+    plan_route("Bury St Edmunds", "Bury St Edmunds", 7200, "key")
+
+    assert len(fake_maps.timed) == 2
+    assert len(fake_maps.routes[0]) == 2
+
+
+def test_plan_route_stops_below_minimum_hop_duration(
+    monkeypatch: pytest.MonkeyPatch, fake_maps: FakeMaps
+) -> None:
+    """
+    Test that planning stops once too little time is left for another stop.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        The pytest monkeypatch fixture.
+    fake_maps : FakeMaps
+        The fake Google Maps API.
+
+    Notes
+    -----
+    The first stop takes under a minute to reach, which leaves less
+    than the minimum hop duration.
+    """
+    monkeypatch.setattr(Constants, "MIN_HOP_DURATION_SECONDS", 3580)
+    _search_one_new_place(fake_maps)
+
+    plan_route("Bury St Edmunds", "Bury St Edmunds", 3600, "key")
+
+    assert len(fake_maps.searches) == 1
+    assert len(fake_maps.routes[0]) == 1
+
+
+def test_plan_route_raises_without_nearby_places(fake_maps: FakeMaps) -> None:
+    """
+    Test that a ValueError is raised when no stop can be found.
+
+    Parameters
+    ----------
+    fake_maps : FakeMaps
+        The fake Google Maps API.
+    """
+    with pytest.raises(ValueError, match="No nearby places found"):
+        plan_route("Bury St Edmunds", "Bury St Edmunds", 3600, "key")
+
+    assert len(fake_maps.searches) == 1
+    assert not fake_maps.routes
+
+
+def test_plan_route_stops_when_end_no_longer_fits(fake_maps: FakeMaps) -> None:
+    """
+    Test that planning stops once traffic means heading straight to the end no longer fits.
+
+    Parameters
+    ----------
+    fake_maps : FakeMaps
+        The fake Google Maps API.
+
+    Notes
+    -----
+    The journey fits when checked up front, but takes twice as long by
+    the first planning step. Without stopping there, every step would
+    search for and time new places that can't fit either.
+    """
+    fake_maps.drift = 2
+    _search_one_new_place(fake_maps)
+
+    with pytest.raises(ValueError, match="No nearby places found"):
+        plan_route("Bury St Edmunds", "Cambridge", 3000, "key")
+
+    assert len(fake_maps.timed) == 1